@@ -10,19 +10,44 @@ __version__ = "0.1.0"
 __author__ = "J. Christopher Westland"
 __email__ = "westland@uic.edu"
 
-from .data import load_dataset, list_datasets
-from .utils import (
-    discovery_sample_size,
-    attribute_sample_size,
-    monetary_unit_sample_size,
-    stratified_sample_allocation,
-    benford_analysis
-)
+import importlib
+
+# Public names are resolved lazily (PEP 562) so that ``import auditanalytics``
+# does not pull in pandas and scipy until a function is actually used.
+_LAZY_ATTRS = {
+    'load_dataset': '.data',
+    'list_datasets': '.data',
+    'discovery_sample_size': '.utils.sampling',
+    'discovery_sample_size_batch': '.utils.sampling',
+    'attribute_sample_size': '.utils.sampling',
+    'monetary_unit_sample_size': '.utils.sampling',
+    'stratified_sample_allocation': '.utils.sampling',
+    'benford_analysis': '.utils.sampling',
+}
+_LAZY_SUBMODULES = ('data', 'utils')
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule binds it as an attribute of the package
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
+
 
 __all__ = [
     'load_dataset', 
     'list_datasets',
     'discovery_sample_size',
+    'discovery_sample_size_batch',
     'attribute_sample_size',
     'monetary_unit_sample_size',
     'stratified_sample_allocation',
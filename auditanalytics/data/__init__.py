@@ -1,6 +1,7 @@
 """Data loading utilities for Audit Analytics package"""
 import pandas as pd
 import os
+from functools import lru_cache
 from pathlib import Path
 
 def load_dataset(name):
@@ -31,6 +32,14 @@ def load_dataset(name):
     
     return pd.read_csv(data_path)
 
+@lru_cache(maxsize=32)
+def _scan_datasets(dirpath, mtime_ns):
+    """Return the dataset names in *dirpath*; *mtime_ns* keys the cache."""
+    with os.scandir(dirpath) as entries:
+        return tuple(entry.name[:-4] for entry in entries
+                     if entry.name.endswith('.csv') and entry.is_file())
+
+
 def list_datasets():
     """
     List all available datasets in the package.
@@ -39,9 +48,14 @@ def list_datasets():
     -------
     list
         List of available dataset names (without .csv extension)
+
+    Notes
+    -----
+    The directory listing is cached and only rescanned when the data
+    directory's modification time changes.
     """
-    current_dir = Path(__file__).parent
-    csv_files = list(current_dir.glob('*.csv'))
-    return [f.stem for f in csv_files]
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    mtime_ns = os.stat(current_dir).st_mtime_ns
+    return list(_scan_datasets(current_dir, mtime_ns))
 
 __all__ = ['load_dataset', 'list_datasets']
@@ -2,7 +2,7 @@
 
 from .sampling import *
 
-__all__ = ['discovery_sample_size', 'attribute_sample_size', 
-           'monetary_unit_sample_size', 'stratified_sample_allocation',
-           'benford_analysis']
+__all__ = ['discovery_sample_size', 'discovery_sample_size_batch',
+           'attribute_sample_size', 'monetary_unit_sample_size',
+           'stratified_sample_allocation', 'benford_analysis']
 
@@ -0,0 +1,34 @@
+"""
+Numba-compiled Benford digit-counting kernels
+
+Imported by ``_benford_kernel`` only when Numba is installed and an input is
+large enough to benefit, so Numba is never loaded by importing the package.
+Each kernel compiles on its first call and is cached on disk.
+"""
+import numpy as np
+from numba import njit, prange
+
+from ._benford_kernel import _PARALLEL_CHUNKS, _benford_chi2, _digit_counts_loop
+
+digit_counts = njit(cache=True)(_digit_counts_loop)
+benford_chi2 = njit(cache=True)(_benford_chi2)
+
+
+@njit(parallel=True, cache=True)
+def digit_counts_parallel(x, digit):
+    """Count digits over contiguous chunks in parallel, then reduce."""
+    n = x.shape[0]
+    chunk = (n + _PARALLEL_CHUNKS - 1) // _PARALLEL_CHUNKS
+    local = np.zeros((_PARALLEL_CHUNKS, 10), np.int64)
+    for c in prange(_PARALLEL_CHUNKS):
+        start = min(c * chunk, n)
+        stop = min(start + chunk, n)
+        local[c] = digit_counts(x[start:stop], digit)
+    return local.sum(axis=0)
+
+
+@njit(cache=True)
+def benford_core(x, digit):
+    """Compiled ``_benford_core`` for use inside other ``@njit`` routines."""
+    counts = digit_counts(x, digit)
+    return counts, benford_chi2(counts, digit)
@@ -0,0 +1,183 @@
+"""
+Significant-digit counting kernels for Benford's Law analysis
+
+Digits are counted with vectorized NumPy. When Numba is installed, inputs
+longer than ``PARALLEL_THRESHOLD`` are counted by a compiled multi-threaded
+kernel instead (see ``_benford_jit``); Numba is only imported the first
+time such an input arrives, so importing the package stays cheap.
+"""
+import importlib.util
+import math
+
+import numpy as np
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Benford first-digit frequencies log10(1 + 1/d) for d = 1..9; later digits
+# are uniform
+BENFORD_FIRST_DIGIT_FREQ = np.log10(1 + 1 / np.arange(1, 10))
+UNIFORM_DIGIT_FREQ = np.full(10, 0.1)
+
+# Inputs longer than this are counted across threads when Numba is available;
+# below it the vectorized NumPy path is faster than importing and starting
+# the compiled kernel. The input is split into a fixed number of chunks that
+# prange spreads over the worker threads
+PARALLEL_THRESHOLD = 1_000_000
+_PARALLEL_CHUNKS = 64
+
+# Powers of ten for the two half-shifts used when rescaling float64 values
+_POW10_OFFSET = 200
+_POW10 = 10.0 ** np.arange(-_POW10_OFFSET, _POW10_OFFSET + 1)
+
+
+def _digit_counts_numpy(x, digit):
+    """Vectorized NumPy implementation of ``digit_counts``."""
+    x = x[(x > 0) & (x < np.inf)]
+    # Scale each value so that its first `digit` significant digits form
+    # the integer part
+    shift = (digit - 1) - np.floor(np.log10(x))
+    # Apply the power of ten in two halves so subnormal inputs don't overflow
+    half = np.floor(shift / 2)
+    scaled = x * np.power(10.0, half) * np.power(10.0, shift - half)
+    # log10 can land one decade high for values just below a power of ten
+    scaled = np.where(scaled < 10.0 ** (digit - 1), scaled * 10, scaled)
+    # Rounding to 15 significant digits removes float noise from the
+    # rescaling (e.g. 0.3 -> 2.9999...) without touching genuine digits
+    scaled = np.round(scaled, 15 - digit)
+    scaled = np.where(scaled >= 10.0 ** digit, scaled / 10, scaled)
+    digits = scaled.astype(np.int64) % 10
+    return np.bincount(digits, minlength=10)
+
+
+def _digit_counts_loop(x, digit):
+    """Single-pass loop implementation of ``digit_counts`` for Numba."""
+    counts = np.zeros(10, np.int64)
+    lower = 10.0 ** (digit - 1)
+    upper = 10.0 ** digit
+    rounding = 10.0 ** (15 - digit)
+    for i in range(x.shape[0]):
+        v = x[i]
+        if not 0.0 < v < math.inf:
+            continue
+        shift = (digit - 1) - int(math.floor(math.log10(v)))
+        half = shift // 2
+        scaled = (v * _POW10[half + _POW10_OFFSET]
+                  * _POW10[shift - half + _POW10_OFFSET])
+        if scaled < lower:
+            scaled *= 10
+        scaled = np.rint(scaled * rounding) / rounding
+        if scaled >= upper:
+            scaled /= 10
+        counts[int(scaled) % 10] += 1
+    return counts
+
+
+def digit_counts(x, digit):
+    """
+    Count occurrences of each value 0-9 at a significant-digit position.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        1-D float64 array; values that are not positive and finite are
+        skipped
+    digit : int
+        Significant-digit position (1 for the first digit)
+
+    Returns
+    -------
+    numpy.ndarray
+        Length-10 array of counts indexed by digit value
+    """
+    global HAS_NUMBA
+    if HAS_NUMBA and x.shape[0] > PARALLEL_THRESHOLD:
+        try:
+            from ._benford_jit import digit_counts_parallel
+        except ImportError:
+            # Installed but unloadable (e.g. built against another NumPy);
+            # stop retrying the import on every call
+            HAS_NUMBA = False
+        else:
+            return digit_counts_parallel(x, digit)
+    return _digit_counts_numpy(x, digit)
+
+
+def string_digit_counts(s, digit):
+    """
+    Count occurrences of each value 0-9 at a digit position of strings.
+
+    Fallback for data held as text, such as invoice or check numbers.
+    Surrounding whitespace and any '.', '-' or ',' characters are removed
+    and leading zeros stripped; the digit is then read at position `digit`
+    of what remains. Entries without a digit at that position are skipped.
+
+    Parameters
+    ----------
+    s : numpy.ndarray
+        1-D array of str or bytes
+    digit : int
+        Digit position (1 for the first significant digit)
+
+    Returns
+    -------
+    numpy.ndarray
+        Length-10 array of counts indexed by digit value
+    """
+    s = np.char.strip(s.astype(str))
+    for separator in '.-,':
+        s = np.char.replace(s, separator, '')
+    s = np.ascontiguousarray(np.char.lstrip(s, '0'))
+    width = s.dtype.itemsize // 4
+    if width < digit:
+        return np.zeros(10, dtype=np.int64)
+    # View each fixed-width string as a row of UCS-4 code points
+    chars = s.view('U1').reshape(len(s), width)[:, digit - 1]
+    codes = chars.view(np.uint32) - np.uint32(ord('0'))
+    return np.bincount(codes[codes < 10], minlength=10)
+
+
+def _benford_chi2(counts, digit):
+    """Chi-square statistic of a digit histogram against Benford frequencies."""
+    if digit == 1:
+        observed = counts[1:]
+        expected_freq = BENFORD_FIRST_DIGIT_FREQ
+    else:
+        observed = counts[0:]
+        expected_freq = UNIFORM_DIGIT_FREQ
+    total = observed.sum()
+    if total == 0:
+        return np.nan
+    chi2_stat = 0.0
+    for i in range(observed.shape[0]):
+        expected = expected_freq[i] * total
+        chi2_stat += (observed[i] - expected) ** 2 / expected
+    return chi2_stat
+
+
+def _benford_core(x, digit):
+    """
+    Count significant digits and compute the Benford chi-square statistic.
+    
+    Uses only NumPy and ``math`` primitives. A compiled equivalent for
+    calling from other ``@njit`` audit routines is
+    ``_benford_jit.benford_core``. The p-value needs scipy and is left to
+    the caller (see ``benford_analysis``).
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        1-D float64 array; values that are not positive and finite are
+        skipped
+    digit : int
+        Significant-digit position (1 for the first digit)
+    
+    Returns
+    -------
+    counts : numpy.ndarray
+        Length-10 array of counts indexed by digit value
+    chi2_stat : float
+        Chi-square statistic over digits 1-9 for the first digit and 0-9
+        otherwise, or NaN if no values were counted
+    """
+    counts = digit_counts(x, digit)
+    return counts, _benford_chi2(counts, digit)
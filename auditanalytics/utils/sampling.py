@@ -4,10 +4,36 @@ Utility functions for audit analytics
 This module provides common audit functions for sampling, statistical analysis,
 and audit-specific calculations.
 """
+import heapq
+import math
+import operator
+from functools import lru_cache
+
 import numpy as np
-from scipy import stats
 import pandas as pd
 
+from ._benford_kernel import (
+    BENFORD_FIRST_DIGIT_FREQ,
+    UNIFORM_DIGIT_FREQ,
+    _benford_chi2,
+    _benford_core,
+    string_digit_counts,
+)
+
+
+@lru_cache(maxsize=1024)
+def _discovery_sample_size(confidence, intolerable_error_rate):
+    """Cached worker for ``discovery_sample_size`` on float arguments."""
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if not 0 < intolerable_error_rate < 1:
+        raise ValueError("intolerable_error_rate must be between 0 and 1")
+    
+    # log1p(-r) keeps precision for small error rates, where forming 1 - r
+    # would round away digits of r
+    n = math.log1p(-confidence) / math.log1p(-intolerable_error_rate)
+    return math.ceil(n)
+
 
 def discovery_sample_size(confidence, intolerable_error_rate):
     """
@@ -29,16 +55,95 @@ def discovery_sample_size(confidence, intolerable_error_rate):
     int
         Required sample size (rounded up)
         
+    Raises
+    ------
+    ValueError
+        If `confidence` or `intolerable_error_rate` lies outside (0, 1)
+        
     Examples
     --------
     >>> discovery_sample_size(0.95, 0.05)
     59
     
+    Notes
+    -----
+    Results are memoized on the arguments converted to float, so NumPy
+    scalars and 0-d arrays share cache entries with plain floats. Use
+    ``discovery_sample_size.cache_info()`` to inspect cache usage.
+
     References
     ----------
     Based on discovery sampling methodology for audit testing.
     """
-    n = np.log(1 - confidence) / np.log(1 - intolerable_error_rate)
+    return _discovery_sample_size(float(confidence), float(intolerable_error_rate))
+
+
+discovery_sample_size.cache_info = _discovery_sample_size.cache_info
+discovery_sample_size.cache_clear = _discovery_sample_size.cache_clear
+
+
+def discovery_sample_size_batch(confidence, intolerable_error_rate):
+    """
+    Calculate discovery sample sizes over arrays of inputs.
+    
+    Vectorized form of `discovery_sample_size` for sweeping a grid of
+    sampling plans. Inputs are broadcast against each other.
+    
+    Parameters
+    ----------
+    confidence : float or array-like
+        Confidence level(s) (e.g., 0.95 for 95% confidence)
+    intolerable_error_rate : float or array-like
+        Maximum acceptable error rate(s) (e.g., 0.05 for 5%)
+        
+    Returns
+    -------
+    numpy.ndarray
+        Required sample sizes (rounded up) as int64
+        
+    Raises
+    ------
+    ValueError
+        If any confidence or error rate lies outside (0, 1)
+        
+    Examples
+    --------
+    >>> discovery_sample_size_batch([0.90, 0.95, 0.99], 0.05)
+    array([45, 59, 90])
+    """
+    confidence = np.asarray(confidence, dtype=np.float64)
+    intolerable_error_rate = np.asarray(intolerable_error_rate, dtype=np.float64)
+    
+    # Test for being inside (0, 1) so that NaN fails the check as well
+    if not np.all((confidence > 0) & (confidence < 1)):
+        raise ValueError("confidence must be between 0 and 1")
+    if not np.all((intolerable_error_rate > 0) & (intolerable_error_rate < 1)):
+        raise ValueError("intolerable_error_rate must be between 0 and 1")
+    
+    # Same formula as the scalar version; log1p matters for the small rates
+    n = np.log1p(-confidence) / np.log1p(-intolerable_error_rate)
+    return np.ceil(n).astype(np.int64)
+
+
+@lru_cache(maxsize=128)
+def _z_sum(sig_level, power):
+    """Sum of the normal quantiles z(1 - sig_level) + z(power)."""
+    from scipy import special
+    
+    return special.ndtri(1 - sig_level) + special.ndtri(power)
+
+
+@lru_cache(maxsize=1024)
+def _attribute_sample_size(size, delta_pct, sigma_pct, sig_level, power):
+    """Cached worker for ``attribute_sample_size`` on float arguments."""
+    delta = delta_pct * size
+    sigma = sigma_pct * size
+    effect = delta / sigma
+    
+    # Using simplified power analysis for one-sample test
+    # For more accurate results, use statsmodels.stats.power
+    n = (_z_sum(sig_level, power) / effect) ** 2
+    
     return int(np.ceil(n))
 
 
@@ -71,24 +176,23 @@ def attribute_sample_size(size, delta_pct, sigma_pct, sig_level=0.05, power=0.8)
     Examples
     --------
     >>> attribute_sample_size(1000, 0.05, 0.3)
-    7
+    223
     
     Notes
     -----
     This is a simplified calculation. For production use, consider using
     specialized power analysis packages like statsmodels.stats.power.
+
+    Results are memoized on the arguments converted to float, so NumPy
+    scalars and 0-d arrays share cache entries with plain floats. Use
+    ``attribute_sample_size.cache_info()`` to inspect cache usage.
     """
-    delta = delta_pct * size
-    sigma = sigma_pct * size
-    effect = delta / sigma
-    
-    # Using simplified power analysis for one-sample test
-    # For more accurate results, use statsmodels.stats.power
-    z_alpha = stats.norm.ppf(1 - sig_level)
-    z_beta = stats.norm.ppf(power)
-    n = ((z_alpha + z_beta) / effect) ** 2
-    
-    return int(np.ceil(n))
+    return _attribute_sample_size(float(size), float(delta_pct), float(sigma_pct),
+                                  float(sig_level), float(power))
+
+
+attribute_sample_size.cache_info = _attribute_sample_size.cache_info
+attribute_sample_size.cache_clear = _attribute_sample_size.cache_clear
 
 
 def monetary_unit_sample_size(population_value, tolerable_error, confidence=0.95, 
@@ -117,8 +221,8 @@ def monetary_unit_sample_size(population_value, tolerable_error, confidence=0.95
     >>> monetary_unit_sample_size(1000000, 50000, 0.95)
     60
     """
-    # Risk factor for zero errors at given confidence
-    risk_factor = -np.log(1 - confidence)
+    # Risk factor -ln(1 - c) for zero errors at given confidence
+    risk_factor = -math.log1p(-confidence)
     
     # Adjust for expected errors
     if expected_error_rate > 0:
@@ -127,13 +231,20 @@ def monetary_unit_sample_size(population_value, tolerable_error, confidence=0.95
     # Calculate sample size
     n = (population_value * risk_factor) / tolerable_error
     
-    return int(np.ceil(n))
+    return math.ceil(n)
 
 
-def stratified_sample_allocation(strata_sizes, strata_variances, total_sample_size):
+def stratified_sample_allocation(strata_sizes, strata_variances, total_sample_size,
+                                 method='wright'):
     """
     Allocate sample across strata using Neyman allocation.
     
+    The default method is Wright's exact integer allocation, which gives
+    every non-empty stratum one item and then assigns each further item
+    to the stratum with the highest priority N_h * S_h / sqrt(n_h * (n_h + 1)).
+    This yields the integer allocation that minimizes the variance of the
+    stratified estimator, without rounding.
+    
     Parameters
     ----------
     strata_sizes : array-like
@@ -141,41 +252,121 @@ def stratified_sample_allocation(strata_sizes, strata_variances, total_sample_si
     strata_variances : array-like
         Variance estimate for each stratum
     total_sample_size : int
-        Total sample size to allocate
+        Total sample size to allocate; whole-valued floats such as 60.0
+        are accepted
+    method : {'wright', 'neyman_float'}, optional
+        'wright' for exact integer allocation (default). 'neyman_float'
+        computes the continuous allocation n * N_h * S_h / sum(N_i * S_i)
+        and rounds it by largest remainder.
         
     Returns
     -------
     numpy.ndarray
-        Sample size for each stratum (rounded)
+        Sample size for each stratum
+        
+    Raises
+    ------
+    ValueError
+        If `total_sample_size` is negative, not a whole number or exceeds
+        the total number of items, or `method` is not recognised
         
     Examples
     --------
     >>> stratified_sample_allocation([100, 200, 300], [10, 20, 30], 60)
-    array([ 6, 17, 37])
+    array([ 7, 19, 34])
+    
+    Notes
+    -----
+    Both methods cap each stratum at its size and reallocate the excess
+    to the remaining strata, so the result always sums to
+    `total_sample_size`.
+    
+    References
+    ----------
+    Wright, T. (2017). Exact optimal sample allocation: More efficient than
+    Neyman. Statistics & Probability Letters, 129, 50-57.
     """
-    strata_sizes = np.array(strata_sizes)
-    strata_variances = np.array(strata_variances)
+    strata_sizes = np.asarray(strata_sizes)
+    
+    try:
+        n = operator.index(total_sample_size)
+    except TypeError:
+        n = int(total_sample_size)
+        if n != total_sample_size:
+            raise ValueError("total_sample_size must be a whole number") from None
+    total_sample_size = n
+    if total_sample_size < 0:
+        raise ValueError("total_sample_size must be non-negative")
+    if total_sample_size > strata_sizes.sum():
+        raise ValueError("total_sample_size exceeds the number of items in all strata")
     
-    # Neyman allocation
-    strata_stds = np.sqrt(strata_variances)
-    weights = strata_sizes * strata_stds
-    weights = weights / weights.sum()
+    # Neyman weights N_h * S_h
+    weights = strata_sizes * np.sqrt(strata_variances)
     
-    allocation = weights * total_sample_size
+    if method == 'wright':
+        return _wright_allocation(strata_sizes, weights, total_sample_size)
+    if method == 'neyman_float':
+        return _neyman_float_allocation(strata_sizes, weights, total_sample_size)
+    raise ValueError(f"Unknown allocation method '{method}'; "
+                     "expected 'wright' or 'neyman_float'")
+
+
+def _wright_allocation(strata_sizes, weights, total_sample_size):
+    """Exact integer Neyman allocation by Wright's priority algorithm."""
+    allocation = np.zeros(len(weights), dtype=int)
+    
+    # One item per non-empty stratum, highest weights first if the sample
+    # is too small to cover every stratum; equal weights (e.g. zero
+    # variances) go to the larger stratum
+    nonempty = np.flatnonzero(strata_sizes > 0)
+    first = nonempty[np.lexsort((-strata_sizes[nonempty], -weights[nonempty]))]
+    allocation[first[:total_sample_size]] = 1
+    remaining = total_sample_size - allocation.sum()
     
-    # Round to integers, ensuring total equals target
-    allocation = np.round(allocation).astype(int)
+    def priority(h):
+        # Ties on N_h * S_h fall back to Wright's priority on N_h alone,
+        # which spreads them proportionally to stratum size
+        d = math.sqrt(allocation[h] * (allocation[h] + 1))
+        return (-weights[h] / d, -strata_sizes[h] / d, h)
     
-    # Adjust for rounding errors
-    diff = total_sample_size - allocation.sum()
-    if diff != 0:
-        # Add/subtract from largest stratum
-        idx = np.argmax(allocation)
-        allocation[idx] += diff
+    heap = [priority(h) for h in first if 0 < allocation[h] < strata_sizes[h]]
+    heapq.heapify(heap)
+    for _ in range(remaining):
+        h = heapq.heappop(heap)[-1]
+        allocation[h] += 1
+        if allocation[h] < strata_sizes[h]:
+            heapq.heappush(heap, priority(h))
     
     return allocation
 
 
+def _neyman_float_allocation(strata_sizes, weights, total_sample_size):
+    """Continuous Neyman allocation rounded by largest remainder."""
+    # Strata whose share exceeds their size are taken in full and the
+    # remaining sample is reallocated over the others
+    capped = np.zeros(len(weights), dtype=bool)
+    while True:
+        remaining = total_sample_size - strata_sizes[capped].sum()
+        free_weights = np.where(capped, 0, weights)
+        if free_weights.sum() == 0:
+            # Only zero-variance strata left: fall back to proportional
+            free_weights = np.where(capped, 0, strata_sizes)
+        allocation = (np.where(capped, strata_sizes, 0)
+                      + free_weights * (remaining / free_weights.sum()))
+        over = ~capped & (allocation > strata_sizes)
+        if not over.any():
+            break
+        capped |= over
+    
+    # Round down, then hand the leftover units to the largest remainders
+    rounded = np.floor(allocation).astype(int)
+    leftover = total_sample_size - rounded.sum()
+    order = np.argsort(rounded - allocation, kind='stable')
+    rounded[order[:leftover]] += 1
+    
+    return rounded
+
+
 def benford_analysis(data, digit=1):
     """
     Perform Benford's Law analysis on numerical data.
@@ -196,7 +387,7 @@ def benford_analysis(data, digit=1):
     Examples
     --------
     >>> import numpy as np
-    >>> data = np.random.exponential(1000, 100)
+    >>> data = np.random.default_rng(42).exponential(1000, 100)
     >>> results = benford_analysis(data, digit=1)
     
     Notes
@@ -204,42 +395,61 @@ def benford_analysis(data, digit=1):
     This function filters out non-positive values (zeros and negatives) as 
     Benford's Law only applies to positive values. Users should be aware that
     zero and negative values in the input data will be excluded from the analysis.
+    Missing (NaN) and infinite values are excluded as well.
+
+    String data (e.g. invoice or check numbers), whether a NumPy string
+    array or a pandas Series/object array of str, is read character-wise
+    instead: '.', '-' and ',' are removed, leading zeros stripped, and
+    entries without a digit at the requested position are skipped.
+
+    Digits are read from each value's base-10 mantissa rounded to 15
+    significant digits. This agrees with the value as written for literals
+    of up to 15 significant digits; longer ones can round up a decade
+    (999.9999999999999 counts as 1000), and subnormals below about 2.2e-308
+    are read from their stored value (5e-324 is stored as 4.94e-324).
+    When Numba is installed, inputs of more than a million values are
+    counted by a compiled multi-threaded kernel.
     """
-    data = np.array(data)
-    # Only positive values - Benford's Law applies to positive numbers only
-    data = data[data > 0]
+    string_series = isinstance(getattr(data, 'dtype', None), pd.StringDtype)
+    # asarray avoids copying arrays and Series passed in as-is
+    data = np.asarray(data)
     
-    if len(data) == 0:
-        raise ValueError("No positive values in data for Benford's Law analysis")
-    
-    # Extract the specified digit
-    data_str = data.astype(str)
-    digits = []
-    for val in data_str:
-        # Remove decimal point and get digit
-        val_clean = val.replace('.', '').replace('-', '')
-        if len(val_clean) >= digit:
-            digits.append(int(val_clean[digit-1]))
+    if (string_series or data.dtype.kind in 'US'
+            or (data.dtype.kind == 'O'
+                and pd.api.types.infer_dtype(data.ravel(), skipna=True) == 'string')):
+        # Digits held as text (e.g. invoice numbers) are read character-wise
+        counts = string_digit_counts(data.ravel(), digit)
+        if counts.sum() == 0:
+            raise ValueError(f"No entries with a digit at position {digit} in "
+                             "string data for Benford's Law analysis")
+        chi2_stat = _benford_chi2(counts, digit)
+    else:
+        # Count each digit value 0-9 at the requested position. Only positive
+        # values count - Benford's Law applies to positive numbers only - and
+        # the kernel skips the rest in the same pass
+        data = np.asarray(data, dtype=np.float64).ravel()
+        counts, chi2_stat = _benford_core(data, digit)
     
-    digits = np.array(digits)
+    if counts.sum() == 0:
+        raise ValueError("No positive values in data for Benford's Law analysis")
     
     if digit == 1:
         # Benford's law for first digit
-        possible_digits = range(1, 10)
-        expected_freq = [np.log10(1 + 1/d) for d in possible_digits]
+        possible_digits = np.arange(1, 10)
+        expected_freq = BENFORD_FIRST_DIGIT_FREQ
     else:
         # Uniform distribution for other digits
-        possible_digits = range(0, 10)
-        expected_freq = [0.1] * 10
+        possible_digits = np.arange(0, 10)
+        expected_freq = UNIFORM_DIGIT_FREQ
     
     # Calculate observed frequencies
-    observed_counts = [np.sum(digits == d) for d in possible_digits]
-    total = sum(observed_counts)
-    observed_freq = [c / total for c in observed_counts]
+    observed_counts = counts[possible_digits]
+    total = observed_counts.sum()
+    observed_freq = observed_counts / total
     
     # Chi-square test
-    expected_counts = [f * total for f in expected_freq]
-    chi2_components = [(o - e)**2 / e for o, e in zip(observed_counts, expected_counts)]
+    expected_counts = expected_freq * total
+    chi2_components = (observed_counts - expected_counts)**2 / expected_counts
     
     results = pd.DataFrame({
         'Digit': possible_digits,
@@ -250,8 +460,11 @@ def benford_analysis(data, digit=1):
         'Chi2_Component': chi2_components
     })
     
-    chi2_stat = sum(chi2_components)
-    p_value = 1 - stats.chi2.cdf(chi2_stat, len(possible_digits) - 1)
+    from scipy import stats
+    
+    chi2_stat = float(chi2_stat)
+    # Survival function keeps precision for very small p-values
+    p_value = float(stats.chi2.sf(chi2_stat, len(possible_digits) - 1))
     
     results.attrs['chi2_statistic'] = chi2_stat
     results.attrs['p_value'] = p_value
@@ -261,6 +474,7 @@ def benford_analysis(data, digit=1):
 
 __all__ = [
     'discovery_sample_size',
+    'discovery_sample_size_batch',
     'attribute_sample_size', 
     'monetary_unit_sample_size',
     'stratified_sample_allocation',
@@ -76,8 +76,8 @@ def main():
     print("\n5. Benford's Law Analysis:")
     print("   - Generating sample financial data...")
     # Generate realistic financial data using exponential distribution
-    np.random.seed(42)
-    financial_data = np.random.exponential(1000, 500)
+    rng = np.random.default_rng(42)
+    financial_data = rng.exponential(1000, 500)
     results = aa.benford_analysis(financial_data)
     print(f"   - Chi-square statistic: {results.attrs['chi2_statistic']:.4f}")
     print(f"   - P-value: {results.attrs['p_value']:.4f}")
@@ -46,6 +46,13 @@ def test_dataset_not_found():
             pass  # Expected
 
 
+def test_submodule_access():
+    """Test that submodules are reachable as package attributes"""
+    assert aa.utils.benford_analysis is aa.benford_analysis
+    assert aa.data.load_dataset is aa.load_dataset
+    assert {'data', 'utils'} <= set(dir(aa))
+
+
 if __name__ == '__main__':
     # Run basic tests without pytest
     print("Running smoke tests...")
@@ -62,4 +69,7 @@ if __name__ == '__main__':
     print("✓ Test dataset not found")
     test_dataset_not_found()
     
+    print("✓ Test submodule access")
+    test_submodule_access()
+    
     print("\n✓ All tests passed!")
@@ -0,0 +1,313 @@
+"""
+Tests for the audit sampling utilities
+"""
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+import auditanalytics as aa
+from auditanalytics.utils import _benford_kernel
+
+
+def _assert_raises(exc, func, *args):
+    if HAS_PYTEST:
+        with pytest.raises(exc):
+            func(*args)
+    else:
+        try:
+            func(*args)
+            assert False, f"Should have raised {exc.__name__}"
+        except exc:
+            pass  # Expected
+
+
+def test_discovery_sample_size():
+    """Test discovery sample size for a standard plan"""
+    assert aa.discovery_sample_size(0.95, 0.05) == 59
+
+
+def test_sample_size_numpy_scalars():
+    """Test that NumPy scalars and 0-d arrays are accepted"""
+    assert aa.discovery_sample_size(np.array(0.95), np.float64(0.05)) == 59
+    assert aa.attribute_sample_size(np.array(1000), 0.05, np.float64(0.3)) == 223
+
+
+def test_discovery_sample_size_batch():
+    """Test that the batch form broadcasts and matches the scalar form"""
+    confidence = np.array([[0.90], [0.95], [0.99]])
+    rates = np.array([0.01, 0.05, 0.10])
+    sizes = aa.discovery_sample_size_batch(confidence, rates)
+    assert sizes.shape == (3, 3)
+    assert sizes.dtype == np.int64
+    for i, c in enumerate(confidence[:, 0]):
+        for j, r in enumerate(rates):
+            assert sizes[i, j] == aa.discovery_sample_size(c, r)
+
+
+def test_discovery_sample_size_batch_invalid_raises():
+    """Test that the batch form rejects out-of-range and NaN inputs"""
+    batch = aa.discovery_sample_size_batch
+    _assert_raises(ValueError, batch, [0.95, 1.0], 0.05)
+    _assert_raises(ValueError, batch, [np.nan, 0.95], 0.05)
+    _assert_raises(ValueError, batch, 0.95, [0.05, 0])
+    _assert_raises(ValueError, batch, 0.95, [0.05, np.nan])
+
+
+def test_zero_intolerable_rate_raises():
+    """Test that a zero intolerable error rate is rejected"""
+    _assert_raises(ValueError, aa.discovery_sample_size, 0.95, 0)
+
+
+def test_invalid_confidence_raises():
+    """Test that confidence outside (0, 1) is rejected"""
+    _assert_raises(ValueError, aa.discovery_sample_size, 1.0, 0.05)
+    _assert_raises(ValueError, aa.discovery_sample_size, 0.0, 0.05)
+
+
+def test_confidence_boundary():
+    """Test discovery sample size at very high confidence"""
+    assert aa.discovery_sample_size(0.9999, 0.05) == 180
+
+
+def test_monetary_unit_sample_size():
+    """Test MUS sample size at standard and very high confidence"""
+    assert aa.monetary_unit_sample_size(1000000, 50000, 0.95) == 60
+    assert aa.monetary_unit_sample_size(1000000, 50000, 0.9999) == 185
+
+
+def test_stratified_allocation_sums_to_total():
+    """Test that the allocation uses the whole sample"""
+    allocation = aa.stratified_sample_allocation([100, 200, 300], [10, 20, 30], 60)
+    assert allocation.tolist() == [7, 19, 34]
+    assert allocation.sum() == 60
+
+
+def test_stratified_allocation_caps_strata():
+    """Test that no stratum is allocated more items than it holds"""
+    sizes = [5, 200, 300]
+    for method in ('wright', 'neyman_float'):
+        allocation = aa.stratified_sample_allocation(sizes, [10000, 1, 1], 50,
+                                                     method=method)
+        assert allocation[0] == 5
+        assert (allocation <= sizes).all()
+        assert allocation.sum() == 50
+
+
+def test_stratified_allocation_neyman_float():
+    """Test the rounded continuous Neyman allocation"""
+    allocation = aa.stratified_sample_allocation([100, 200, 300], [10, 20, 30], 60,
+                                                 method='neyman_float')
+    assert allocation.tolist() == [7, 19, 34]
+
+
+def test_stratified_allocation_small_variances():
+    """Test that tiny Neyman weights still allocate the whole sample"""
+    for method in ('wright', 'neyman_float'):
+        assert aa.stratified_sample_allocation([100, 100], [1e-10, 1e-10], 50,
+                                               method=method).tolist() == [25, 25]
+        assert aa.stratified_sample_allocation([3, 3, 3], [1e-4] * 3, 6,
+                                               method=method).tolist() == [2, 2, 2]
+
+
+def test_stratified_allocation_zero_variances():
+    """Test that zero-variance strata are allocated by size"""
+    for method in ('wright', 'neyman_float'):
+        assert aa.stratified_sample_allocation([10, 10], [0, 0], 7,
+                                               method=method).tolist() == [4, 3]
+        assert aa.stratified_sample_allocation([10, 30], [0, 0], 8,
+                                               method=method).tolist() == [2, 6]
+
+
+def test_stratified_allocation_float_total():
+    """Test that a whole-valued float sample size is accepted"""
+    allocation = aa.stratified_sample_allocation([100, 200, 300], [10, 20, 30], 60.0)
+    assert allocation.tolist() == [7, 19, 34]
+    _assert_raises(ValueError, aa.stratified_sample_allocation,
+                   [100, 200, 300], [10, 20, 30], 60.5)
+
+
+def test_stratified_allocation_invalid_raises():
+    """Test that an oversized sample or unknown method is rejected"""
+    _assert_raises(ValueError, aa.stratified_sample_allocation,
+                   [100, 200, 300], [10, 20, 30], 601)
+    _assert_raises(ValueError, aa.stratified_sample_allocation,
+                   [100, 200, 300], [10, 20, 30], 60, 'proportional')
+
+
+def test_benford_first_digit_counts():
+    """Test first-digit counts for a known histogram"""
+    data = [1, 2, 2, 3, 3, 3, 0.45, 9.99, 100, 0.001]
+    results = aa.benford_analysis(data, digit=1)
+    assert results['Digit'].tolist() == list(range(1, 10))
+    assert results['Observed_Count'].tolist() == [3, 2, 3, 1, 0, 0, 0, 0, 1]
+    assert np.isclose(results.attrs['chi2_statistic'],
+                      results['Chi2_Component'].sum())
+
+
+def test_benford_second_digit_counts():
+    """Test second-digit counts for a known histogram"""
+    data = [12, 0.37, 150, 1000, 0.001, 45.6, 7]
+    results = aa.benford_analysis(data, digit=2)
+    assert results['Digit'].tolist() == list(range(10))
+    assert results['Observed_Count'].tolist() == [3, 0, 1, 0, 0, 2, 0, 1, 0, 0]
+
+
+def test_benford_small_values_and_powers_of_ten():
+    """Test digits of values below 1 and exact powers of ten"""
+    data = np.array([1e-300, 1e-5, 0.1, 1, 10, 1e10, 1e300, 0.3, 0.07, 0.999])
+    first = _benford_kernel.digit_counts(data, 1)
+    assert first.tolist() == [0, 7, 0, 1, 0, 0, 0, 1, 0, 1]
+    second = _benford_kernel.digit_counts(data, 2)
+    assert second.tolist() == [9, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+
+
+def test_benford_numba_matches_numpy():
+    """Test that the compiled kernels count the same digits as NumPy"""
+    if not _benford_kernel.HAS_NUMBA:
+        return  # Nothing to compare without Numba
+    from auditanalytics.utils import _benford_jit
+    
+    rng = np.random.default_rng(0)
+    data = np.concatenate([
+        rng.lognormal(0, 20, 10_000),
+        10.0 ** np.arange(-300, 301),
+        [0.0, -5.0, np.nan, np.inf, 0.3, 999.999],
+    ])
+    for digit in (1, 2, 3):
+        expected = _benford_kernel._digit_counts_numpy(data, digit)
+        assert (_benford_jit.digit_counts(data, digit) == expected).all()
+        assert (_benford_jit.digit_counts_parallel(data, digit) == expected).all()
+
+
+def test_benford_unloadable_numba_falls_back():
+    """Test that a Numba install that fails to import falls back to NumPy"""
+    saved_flag = _benford_kernel.HAS_NUMBA
+    saved_modules = {name: sys.modules.pop(name, None)
+                     for name in ('numba', 'auditanalytics.utils._benford_jit')}
+    sys.modules['numba'] = None  # makes `import numba` raise ImportError
+    try:
+        _benford_kernel.HAS_NUMBA = True
+        data = np.full(_benford_kernel.PARALLEL_THRESHOLD + 1, 0.25)
+        assert _benford_kernel.digit_counts(data, 1)[2] == len(data)
+        assert not _benford_kernel.HAS_NUMBA
+    finally:
+        _benford_kernel.HAS_NUMBA = saved_flag
+        for name, module in saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def test_benford_string_array():
+    """Test digit counts for a NumPy string array"""
+    data = np.array(['00123', '4.56', '1-000', ' 78 ', 'N/A', ''])
+    first = aa.benford_analysis(data, digit=1)
+    assert first['Observed_Count'].tolist() == [2, 0, 0, 1, 0, 0, 1, 0, 0]
+    second = aa.benford_analysis(data, digit=2)
+    assert second['Observed_Count'].tolist() == [1, 0, 1, 0, 0, 1, 0, 0, 1, 0]
+
+
+def test_benford_no_positive_values_raises():
+    """Test that empty or non-positive input is rejected"""
+    _assert_raises(ValueError, aa.benford_analysis, [])
+    _assert_raises(ValueError, aa.benford_analysis, [0, -1.5, np.nan])
+
+
+def test_benford_string_series():
+    """Test that pandas string data is read character-wise"""
+    invoices = pd.Series(['0042', 'INV-1', '17', None, '2.5'])
+    for data in (invoices, invoices.astype(object), invoices.astype('string')):
+        results = aa.benford_analysis(data)
+        assert results['Observed_Count'].tolist() == [1, 1, 0, 1, 0, 0, 0, 0, 0]
+
+
+def test_benford_string_without_digits_raises():
+    """Test that text with no digit at the position is rejected"""
+    _assert_raises(ValueError, aa.benford_analysis, pd.Series(['INV', 'N/A']))
+
+
+if __name__ == '__main__':
+    # Run basic tests without pytest
+    print("Running sampling tests...")
+    
+    print("✓ Test discovery_sample_size")
+    test_discovery_sample_size()
+    
+    print("✓ Test sample sizes with NumPy scalars")
+    test_sample_size_numpy_scalars()
+    
+    print("✓ Test discovery_sample_size_batch")
+    test_discovery_sample_size_batch()
+    
+    print("✓ Test discovery_sample_size_batch invalid raises")
+    test_discovery_sample_size_batch_invalid_raises()
+    
+    print("✓ Test zero intolerable rate raises")
+    test_zero_intolerable_rate_raises()
+    
+    print("✓ Test invalid confidence raises")
+    test_invalid_confidence_raises()
+    
+    print("✓ Test confidence boundary")
+    test_confidence_boundary()
+    
+    print("✓ Test monetary_unit_sample_size")
+    test_monetary_unit_sample_size()
+    
+    print("✓ Test stratified allocation sums to total")
+    test_stratified_allocation_sums_to_total()
+    
+    print("✓ Test stratified allocation caps strata")
+    test_stratified_allocation_caps_strata()
+    
+    print("✓ Test stratified allocation neyman_float")
+    test_stratified_allocation_neyman_float()
+    
+    print("✓ Test stratified allocation small variances")
+    test_stratified_allocation_small_variances()
+    
+    print("✓ Test stratified allocation zero variances")
+    test_stratified_allocation_zero_variances()
+    
+    print("✓ Test stratified allocation float total")
+    test_stratified_allocation_float_total()
+    
+    print("✓ Test stratified allocation invalid raises")
+    test_stratified_allocation_invalid_raises()
+    
+    print("✓ Test benford first digit counts")
+    test_benford_first_digit_counts()
+    
+    print("✓ Test benford second digit counts")
+    test_benford_second_digit_counts()
+    
+    print("✓ Test benford small values and powers of ten")
+    test_benford_small_values_and_powers_of_ten()
+    
+    print("✓ Test benford Numba kernels match NumPy")
+    test_benford_numba_matches_numpy()
+    
+    print("✓ Test benford unloadable Numba falls back")
+    test_benford_unloadable_numba_falls_back()
+    
+    print("✓ Test benford string array")
+    test_benford_string_array()
+    
+    print("✓ Test benford no positive values raises")
+    test_benford_no_positive_values_raises()
+    
+    print("✓ Test benford string series")
+    test_benford_string_series()
+    
+    print("✓ Test benford string without digits raises")
+    test_benford_string_without_digits_raises()
+    
+    print("\n✓ All tests passed!")
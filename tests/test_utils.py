@@ -0,0 +1,215 @@
+"""
+Tests for the top-level utils module
+"""
+import contextlib
+import importlib.util
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+LEDGER_CSV = "invoice,amount\n1001,250.00\n1002,99.50\n1003,1200.00\n"
+
+
+@contextlib.contextmanager
+def _data_dir(files):
+    """Point utils at a temporary data directory holding `files`."""
+    saved = utils._DATA_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in files.items():
+            (Path(tmp) / name).write_text(text)
+        utils._DATA_DIR = Path(tmp)
+        try:
+            yield
+        finally:
+            utils._DATA_DIR = saved
+
+
+def test_load_csv_default_engine():
+    """Test that a plain load matches pandas.read_csv"""
+    text = ",amount\n0,250.00\n1,99.50\n"
+    with _data_dir({'ledger.csv': LEDGER_CSV, 'blank.csv': text}):
+        df = utils.load_csv('ledger.csv')
+        blank = utils.load_csv('blank.csv')
+        expected = pd.read_csv(utils.get_data_path('blank.csv'))
+    assert df['invoice'].tolist() == [1001, 1002, 1003]
+    assert df['amount'].dtype == np.float64
+    assert utils.foot_total(df, 'amount') == 1549.5
+    pd.testing.assert_frame_equal(blank, expected)
+    assert blank.columns.tolist() == ['Unnamed: 0', 'amount']
+
+
+def test_load_csv_c_engine_options():
+    """Test that options the PyArrow engine rejects still work"""
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        assert len(utils.load_csv('ledger.csv', nrows=2)) == 2
+        assert len(utils.load_csv('ledger.csv', low_memory=False)) == 3
+        assert len(utils.load_csv('ledger.csv', skiprows=[1])) == 2
+
+
+def test_load_csv_pyarrow_opt_in():
+    """Test that the PyArrow engine is used only when asked for"""
+    if importlib.util.find_spec('pyarrow') is None:
+        return  # Nothing to opt in to without PyArrow
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        df = utils.load_csv('ledger.csv', engine='pyarrow')
+    assert df['invoice'].tolist() == [1001, 1002, 1003]
+    assert utils.foot_total(df, 'amount') == 1549.5
+
+
+def test_load_csv_cached_hits():
+    """Test that repeated loads are served from the cache"""
+    utils.load_csv_cached.cache_clear()
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        first = utils.load_csv_cached('ledger.csv')
+        second = utils.load_csv_cached('ledger.csv')
+    info = utils.load_csv_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_load_csv_cached_unhashable_bypass():
+    """Test that unhashable arguments skip the cache"""
+    utils.load_csv_cached.cache_clear()
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        df = utils.load_csv_cached('ledger.csv', dtype={'invoice': str})
+    assert df['invoice'].tolist() == ['1001', '1002', '1003']
+    assert utils.load_csv_cached.cache_info().currsize == 0
+
+
+def test_load_csv_cached_copy():
+    """Test that copy=True isolates the caller from the cached frame"""
+    utils.load_csv_cached.cache_clear()
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        df = utils.load_csv_cached('ledger.csv', copy=True)
+        df.loc[0, 'amount'] = 0.0
+        assert utils.load_csv_cached('ledger.csv').loc[0, 'amount'] == 250.0
+
+
+def test_load_csv_cached_data_dir():
+    """Test that a different data directory is not served stale frames"""
+    utils.load_csv_cached.cache_clear()
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        assert len(utils.load_csv_cached('ledger.csv')) == 3
+    with _data_dir({'ledger.csv': "invoice,amount\n2001,5.00\n"}):
+        assert utils.load_csv_cached('ledger.csv')['invoice'].tolist() == [2001]
+
+
+def test_load_csv_streaming():
+    """Test that streamed chunks cover the whole file"""
+    with _data_dir({'ledger.csv': LEDGER_CSV}):
+        chunks = list(utils.load_csv_streaming('ledger.csv', chunksize=2))
+        df = utils.load_csv('ledger.csv')
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+
+def test_foot_total_streaming():
+    """Test that footing in chunks matches footing the loaded column"""
+    rows = ["invoice,cents"] + [f"{1000 + i},{i * 125}" for i in range(7)]
+    rows[3] = "1002,"  # forces its chunk to float
+    with _data_dir({'ledger.csv': "\n".join(rows) + "\n"}):
+        expected = utils.foot_total(utils.load_csv('ledger.csv'), 'cents')
+        total = utils.foot_total_streaming('ledger.csv', 'cents', chunksize=3)
+        assert total == expected == 2375
+        assert utils.foot_total_streaming('ledger.csv', 'invoice',
+                                          chunksize=3) == 7021
+        if HAS_PYTEST:
+            with pytest.raises(TypeError):
+                utils.foot_total_streaming('ledger.csv', 'cents', usecols=[0])
+        else:
+            try:
+                utils.foot_total_streaming('ledger.csv', 'cents', usecols=[0])
+                assert False, "Should have raised TypeError"
+            except TypeError:
+                pass  # Expected
+
+
+def test_foot_total_integers():
+    """Test that integer columns foot exactly to an int"""
+    df = pd.DataFrame({'cents': pd.array([10**17, 1, None], dtype='Int64')})
+    total = utils.foot_total(df, 'cents')
+    assert isinstance(total, int)
+    assert total == 10**17 + 1
+
+
+def test_foot_total_large_integers():
+    """Test that integer totals beyond int64 do not wrap"""
+    df = pd.DataFrame({
+        'unsigned': np.array([2**63 + 5, 1, 0], dtype=np.uint64),
+        'signed': np.array([2**62, 2**62, -1], dtype=np.int64),
+    })
+    assert utils.foot_total(df, 'unsigned') == 2**63 + 6
+    assert utils.foot_total(df, 'signed') == 2**63 - 1
+
+
+def test_foot_total_floats():
+    """Test that float columns foot to a float, skipping NaN"""
+    df = pd.DataFrame({'amount': [1.5, np.nan, 2.25]})
+    assert utils.foot_total(df, 'amount') == 3.75
+
+
+def test_foot_total_keeps_other_types():
+    """Test that Decimal and Timedelta columns keep their type"""
+    df = pd.DataFrame({
+        'amount': [Decimal('0.1'), Decimal('0.2')],
+        'elapsed': pd.to_timedelta([1, 2], unit='D'),
+    })
+    assert utils.foot_total(df, 'amount') == Decimal('0.3')
+    assert utils.foot_total(df, 'elapsed') == pd.Timedelta(days=3)
+
+
+if __name__ == '__main__':
+    # Run basic tests without pytest
+    print("Running utils tests...")
+    
+    print("✓ Test load_csv default engine")
+    test_load_csv_default_engine()
+    
+    print("✓ Test load_csv C engine options")
+    test_load_csv_c_engine_options()
+    
+    print("✓ Test load_csv PyArrow opt-in")
+    test_load_csv_pyarrow_opt_in()
+    
+    print("✓ Test load_csv_cached hits")
+    test_load_csv_cached_hits()
+    
+    print("✓ Test load_csv_cached unhashable bypass")
+    test_load_csv_cached_unhashable_bypass()
+    
+    print("✓ Test load_csv_cached copy")
+    test_load_csv_cached_copy()
+    
+    print("✓ Test load_csv_cached data directory")
+    test_load_csv_cached_data_dir()
+    
+    print("✓ Test load_csv_streaming")
+    test_load_csv_streaming()
+    
+    print("✓ Test foot_total_streaming")
+    test_foot_total_streaming()
+    
+    print("✓ Test foot_total integers")
+    test_foot_total_integers()
+    
+    print("✓ Test foot_total large integers")
+    test_foot_total_large_integers()
+    
+    print("✓ Test foot_total floats")
+    test_foot_total_floats()
+    
+    print("✓ Test foot_total keeps other types")
+    test_foot_total_keeps_other_types()
+    
+    print("\n✓ All tests passed!")
@@ -4,11 +4,16 @@ Utility module for audit analytics functions.
 This module provides common utility functions used across the audit analytics package.
 """
 
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
 
+# Data directory, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
 def get_data_path(filename):
     """
     Get the absolute path to a data file in the data directory.
@@ -23,12 +28,7 @@ def get_data_path(filename):
     str
         Absolute path to the data file
     """
-    # Get the package directory
-    package_dir = Path(__file__).parent.parent
-    data_dir = package_dir / "data"
-    
-    # Return the full path
-    return str(data_dir / filename)
+    return str(_DATA_DIR / filename)
 
 
 def load_csv(filename, **kwargs):
@@ -40,17 +40,70 @@ def load_csv(filename, **kwargs):
     filename : str
         Name of the CSV file
     **kwargs : dict
-        Additional arguments to pass to pandas.read_csv()
+        Additional arguments to pass to pandas.read_csv(). The default C
+        engine memory-maps the file; pass engine="pyarrow" to parse with
+        PyArrow's multi-threaded reader, which supports fewer options and
+        can name and type columns differently.
         
     Returns:
     --------
     pd.DataFrame
         Loaded dataframe
     """
-    filepath = get_data_path(filename)
+    return _read_csv(get_data_path(filename), **kwargs)
+
+
+def _read_csv(filepath, **kwargs):
+    if kwargs.get("engine", "c") == "c":
+        # Parse straight from the page cache instead of a read() buffer
+        kwargs.setdefault("memory_map", True)
     return pd.read_csv(filepath, **kwargs)
 
 
+@lru_cache(maxsize=32)
+def _load_csv_cached(filepath, kwarg_items):
+    # Keyed on the full path so a different data directory misses the cache
+    return _read_csv(filepath, **dict(kwarg_items))
+
+
+def load_csv_cached(filename, copy=False, **kwargs):
+    """
+    Load a CSV file from the data directory, reusing earlier parses.
+    
+    Repeated calls with the same file path and keyword arguments return the
+    dataframe parsed on the first call instead of reading the file again.
+    The cache does not notice changes to the file on disk; call
+    ``load_csv_cached.cache_clear()`` to drop it.
+    
+    Parameters:
+    -----------
+    filename : str
+        Name of the CSV file
+    copy : bool
+        If True, return a deep copy that can be modified freely. By default
+        a shallow copy is returned, so adding or dropping columns is safe
+        but values are shared with the cached dataframe.
+    **kwargs : dict
+        Additional arguments to pass to pandas.read_csv(). Calls with
+        unhashable arguments (e.g. a dtype dict) bypass the cache.
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Loaded dataframe
+    """
+    kwarg_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwarg_items)
+    except TypeError:
+        return load_csv(filename, **kwargs)
+    return _load_csv_cached(get_data_path(filename), kwarg_items).copy(deep=copy)
+
+
+load_csv_cached.cache_info = _load_csv_cached.cache_info
+load_csv_cached.cache_clear = _load_csv_cached.cache_clear
+
+
 def foot_total(df, column):
     """
     Calculate the total (foot) of a column in a dataframe.
@@ -66,7 +119,100 @@ def foot_total(df, column):
         
     Returns:
     --------
-    float
-        The sum of the column
+    float, int or object
+        The sum of the column. Integer columns (e.g. amounts in cents)
+        are footed exactly and returned as int, float columns as float;
+        other columns (e.g. Decimal amounts or Timedeltas) are footed with
+        Series.sum() and keep their type. Missing values are skipped.
+    """
+    values = df[column]
+    if values.dtype.kind in 'iub':
+        if values.hasnans:
+            values = values.dropna()
+        arr = values.to_numpy(dtype=np.uint64 if values.dtype.kind == 'u' else np.int64)
+        if arr.size == 0:
+            return 0
+        # The fixed-width accumulator cannot wrap while n * max|x| fits in
+        # it; otherwise foot with Python ints
+        peak = max(abs(int(arr.min())), abs(int(arr.max())))
+        if peak * arr.size <= np.iinfo(arr.dtype).max:
+            return int(np.add.reduce(arr))
+        return sum(arr.tolist())
+    if values.dtype.kind != 'f':
+        return values.sum()
+    
+    # Pairwise NumPy reduction on the underlying float64 buffer
+    arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    total = np.add.reduce(arr)
+    if np.isnan(total):
+        total = np.nansum(arr)
+    return float(total)
+
+
+def load_csv_streaming(filename, chunksize=1_000_000, **kwargs):
+    """
+    Iterate over a CSV file from the data directory in chunks.
+    
+    Only one chunk is held in memory at a time, so multi-gigabyte audit
+    exports can be processed without loading the whole file.
+    
+    Parameters:
+    -----------
+    filename : str
+        Name of the CSV file
+    chunksize : int
+        Number of rows per chunk
+    **kwargs : dict
+        Additional arguments to pass to pandas.read_csv(). The C engine is
+        used, memory-mapping the file, since the PyArrow engine cannot
+        read in chunks.
+        
+    Yields:
+    -------
+    pd.DataFrame
+        Successive chunks of at most `chunksize` rows
+    """
+    kwargs.setdefault("engine", "c")
+    kwargs.setdefault("memory_map", True)
+    filepath = get_data_path(filename)
+    with pd.read_csv(filepath, chunksize=chunksize, **kwargs) as reader:
+        yield from reader
+
+
+def foot_total_streaming(filename, column, chunksize=1_000_000, **kwargs):
+    """
+    Foot a column of a CSV file from the data directory without loading it.
+    
+    Only `column` is parsed, and the file is read `chunksize` rows at a
+    time with each chunk footed as it arrives (see ``foot_total``).
+    
+    Parameters:
+    -----------
+    filename : str
+        Name of the CSV file
+    column : str
+        Name of the column to foot
+    chunksize : int
+        Number of rows per chunk
+    **kwargs : dict
+        Additional arguments to pass to load_csv_streaming(), except
+        usecols
+        
+    Returns:
+    --------
+    float or int
+        The sum of the column; int if every chunk parsed as integers
+        
+    Raises:
+    -------
+    TypeError
+        If `usecols` is passed; only `column` is parsed
     """
-    return df[column].sum()
+    if "usecols" in kwargs:
+        raise TypeError("foot_total_streaming() parses only `column`; "
+                        "usecols cannot be passed")
+    total = 0
+    for chunk in load_csv_streaming(filename, chunksize=chunksize,
+                                    usecols=[column], **kwargs):
+        total += foot_total(chunk, column)
+    return total